@@ -15,23 +15,35 @@ How to use:
 # ]
 # ///
 
+import bisect
+import functools
 import ipaddress
-import math
+import itertools
 import os
+import socket
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Optional, Annotated
+from typing import TYPE_CHECKING, Annotated, ClassVar, Optional
 
 import typer
-from rich import box
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.traceback import install
+
+# Rich is imported where it is used, so that short commands do not pay for
+# loading all of it at startup
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+# Local variables are only shown in tracebacks when debugging, rendering them is costly
+SHOW_LOCALS = bool(os.environ.get("IPNET_DEBUG"))
 
 # Install Rich traceback handler for better error display
-install(show_locals=True, suppress=[typer])
+if os.environ.get("IPNET_RICH_TRACEBACK") == "1":
+    from rich.traceback import install
+
+    install(show_locals=SHOW_LOCALS, suppress=[typer], max_frames=5)
 
 if sys.version_info.major < 3:
     raise SystemExit(
@@ -44,23 +56,56 @@ MAX_DISPLAYED_SUBNETS = 50
 DEFAULT_TABLE_STYLE = "cyan3"
 HOST_COUNT_STYLE = "magenta3"
 HOST_RANGE_STYLE = "gold1"
+# Whether the interpreter path points to a uv managed Python
+UV_IN_EXECUTABLE = "uv" in sys.executable.lower()
+
+# Shared Rich consoles, created on first use
+_stdout_console: Optional["Console"] = None
+_stderr_console: Optional["Console"] = None
+
+
+def _stdout() -> "Console":
+    """Return the shared Rich console on stdout."""
+    global _stdout_console
+    if _stdout_console is None:
+        from rich.console import Console
+
+        _stdout_console = Console()
+    return _stdout_console
+
+
+def _stderr() -> "Console":
+    """Return the shared Rich console on stderr."""
+    global _stderr_console
+    if _stderr_console is None:
+        from rich.console import Console
+
+        _stderr_console = Console(stderr=True)
+    return _stderr_console
 
 
 class ErrorHandler:
     """Centralized error handling with Rich formatting."""
 
-    def __init__(self):
-        self.error_console = Console(stderr=True)
-        # self.console = Console()
+    __slots__ = ()
+
+    @property
+    def error_console(self) -> "Console":
+        """Rich console on stderr."""
+        return _stderr()
 
     def print_error(
         self, title: str, message: str, suggestion: Optional[str] = None
     ) -> None:
-        error_text = Text()
-        error_text.append(f"{message}", style="bold red")
+        from rich import box
+        from rich.markup import escape
+        from rich.panel import Panel
+        from rich.text import Text
 
+        markup = f"[bold red]{escape(message)}[/]"
         if suggestion:
-            error_text.append(f"\n\n{suggestion}", style="dim yellow")
+            markup += f"\n\n[dim yellow]{escape(suggestion)}[/]"
+        error_text = Text.from_markup(markup)
 
         error_panel = Panel(
             error_text,
@@ -78,7 +123,7 @@ class ErrorHandler:
         self, exc: Exception, context: str = "An error occurred"
     ) -> None:
         """Print exception with traceback."""
-        self.error_console.print_exception(show_locals=True)
+        self.error_console.print_exception(show_locals=SHOW_LOCALS, max_frames=3)
 
         # Also show a user-friendly error panel
         self.print_error(
@@ -90,12 +135,15 @@ class ErrorHandler:
 error_handler = ErrorHandler()
 
 
+@functools.cache
 def get_execution_environment() -> dict[str, str]:
     """
     Detect the Python execution environment and return information about it.
 
     https://stackoverflow.com/questions/1871549/how-to-determine-if-python-is-running-inside-a-virtualenv
 
+    The environment cannot change while running, so the result is computed once.
+
     Returns:
         dict: Contains environment type, python version, and path information
     """
@@ -124,74 +172,189 @@ def get_execution_environment() -> dict[str, str]:
             env_info["environment_type"] = "venv"
 
     # Check if we're running with uv (look for uv in executable path or environment)
-    if "uv" in sys.executable.lower() or os.environ.get("UV_PROJECT_ENVIRONMENT"):
+    if UV_IN_EXECUTABLE or os.environ.get("UV_PROJECT_ENVIRONMENT"):
         env_info["environment_type"] = "uv"
 
     return env_info
 
 
-@dataclass
+def _fmt_v4(address: int) -> str:
+    """Format the integer value of an IPv4 address, faster than IPv4Address."""
+    return f"{address >> 24 & 255}.{address >> 16 & 255}.{address >> 8 & 255}.{address & 255}"
+
+
+def _fmt_v6(address: int) -> str:
+    """Format the integer value of an IPv6 address, faster than IPv6Address."""
+    if address >> 32 == 0:
+        # inet_ntop writes these as ::a.b.c.d, keep the ipaddress notation
+        return str(ipaddress.IPv6Address(address))
+    return socket.inet_ntop(socket.AF_INET6, address.to_bytes(16, "big"))
+
+
+def _fmt_count(count: int) -> str:
+    """Format a count exactly, as 2^x for powers of 2 larger than the IPv4 space."""
+    if count > 2**32 and count & (count - 1) == 0:
+        return f"2^{count.bit_length() - 1}"
+    return f"{count:,}"
+
+
+def _int_ranges(
+    networks: list[ipaddress.IPv4Network] | list[ipaddress.IPv6Network],
+) -> tuple[list[int], list[int]]:
+    """Return the sorted (lows, highs) integer bounds of networks, nested ones dropped."""
+    lows: list[int] = []
+    highs: list[int] = []
+    for net in sorted(
+        networks, key=lambda n: (int(n.network_address), -n.num_addresses)
+    ):
+        if highs and int(net.broadcast_address) <= highs[-1]:
+            # Nested in the previous network, which already covers it
+            continue
+        lows.append(int(net.network_address))
+        highs.append(int(net.broadcast_address))
+    return lows, highs
+
+
+def _in_ranges(low: int, high: int, ranges: tuple[list[int], list[int]]) -> bool:
+    """Check if [low, high] is inside one of the ranges built by _int_ranges."""
+    lows, highs = ranges
+    i = bisect.bisect_right(lows, low) - 1
+    return i >= 0 and high <= highs[i]
+
+
+@functools.cache
+def _special_ranges(version: int) -> dict[str, tuple[list[int], list[int]]]:
+    """Integer ranges of the special purpose networks known to ipaddress."""
+    network_class = ipaddress.IPv4Network if version == 4 else ipaddress.IPv6Network
+    constants = network_class._constants
+    ranges = {
+        "private": _int_ranges(constants._private_networks),
+        "private_exceptions": _int_ranges(constants._private_networks_exceptions),
+    }
+    if version == 4:
+        ranges["public"] = _int_ranges([constants._public_network])
+    return ranges
+
+
+def _is_private_int(network_int: int, broadcast_int: int, version: int) -> bool:
+    """Same result as network.is_private, using bisect on integer ranges."""
+    ranges = _special_ranges(version)
+    exceptions = ranges["private_exceptions"]
+    return (
+        _in_ranges(network_int, broadcast_int, ranges["private"])
+        and not _in_ranges(network_int, network_int, exceptions)
+        and not _in_ranges(broadcast_int, broadcast_int, exceptions)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _flags_for(network_int: int, prefixlen: int, version: int) -> tuple[str, ...]:
+    """Compute the flags of a network once, the is_* properties are costly."""
+    network_class = ipaddress.IPv4Network if version == 4 else ipaddress.IPv6Network
+    network = network_class((network_int, prefixlen))
+    broadcast_int = network_int + network.num_addresses - 1
+
+    # is_private and is_global scan lists of networks, use integer ranges instead
+    is_private = _is_private_int(network_int, broadcast_int, version)
+    is_global = not is_private
+    if version == 4:
+        # 100.64.0.0/10 is neither private nor global
+        public = _special_ranges(4)["public"]
+        is_global = is_global and not _in_ranges(network_int, broadcast_int, public)
+
+    flags = []
+    if network.is_multicast:
+        flags.append("MCAST")
+    if is_private:
+        flags.append("PRIVATE")
+    if is_global:
+        flags.append("GLOBAL")
+    if network.is_unspecified:
+        flags.append("UNSPECIFIED")
+    if network.is_reserved:
+        flags.append("RESERVED")
+    if network.is_loopback:
+        flags.append("LOOPBACK")
+    if network.is_link_local:
+        flags.append("LINK_LOCAL")
+    return tuple(flags)
+
+
+@dataclass(slots=True)
 class TableConfig:
     """Configuration for Rich table styling."""
 
     border_style: str = DEFAULT_TABLE_STYLE
     title_style: str = f"italic {DEFAULT_TABLE_STYLE}"
-    box_style = box.ROUNDED
+    box_style: ClassVar[str] = "ROUNDED"  # Name of the rich.box style
     title_justify: str = "center"
 
 
 class SubnetCalculator:
     """IPv4/IPv6 subnet calculator with Rich formatting."""
 
-    def __init__(self, console: Optional[Console] = None):
-        self.console = console or Console()
+    __slots__ = ("console", "table_config", "_plain")
+
+    def __init__(self, console: Optional["Console"] = None):
+        self.console = console or _stdout()
         self.table_config = TableConfig()
+        # Output piped to another program gets plain rows, without any Rich rendering
+        self._plain = not self.console.is_terminal
 
     def display_subnet_info(
         self, network: ipaddress.IPv4Network | ipaddress.IPv6Network
     ) -> None:
         """Display comprehensive subnet information in a Rich panel."""
-        # Create main info table
-        info_table = Table.grid(padding=(0, 2))
-        info_table.add_column(style="bold cyan", no_wrap=True)
-        info_table.add_column(style="white")
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+
+        # Collect the rows first, the grid is built once they are all known
+        rows: list[tuple[str, str]] = []
+
+        # Addresses are formatted from their integer value
+        fmt = _fmt_v4 if network.version == 4 else _fmt_v6
+        network_int = int(network.network_address)
+        broadcast_int = network_int + network.num_addresses - 1
 
         # Basic network information
-        info_table.add_row("Version:", f"[bold magenta]IPv{network.version}[/]")
-        info_table.add_row("Addresses:", f"[bold yellow]{network.num_addresses:,G}[/]")
-        info_table.add_row("Subnet:", f"[bold green]{network.with_prefixlen}[/]")
-        info_table.add_row("Netmask:", f"{network.netmask}")
-        info_table.add_row("Hostmask:", f"{network.hostmask}")
+        rows.append(("Version:", f"[bold magenta]IPv{network.version}[/]"))
+        rows.append(
+            ("Addresses:", f"[bold yellow]{_fmt_count(network.num_addresses)}[/]")
+        )
+        rows.append(("Subnet:", f"[bold green]{network.with_prefixlen}[/]"))
+        rows.append(("Netmask:", fmt(int(network.netmask))))
+        rows.append(("Hostmask:", fmt(int(network.hostmask))))
 
         # IPv6 specific information
         if network.version == 6:
-            info_table.add_row("Expanded:", f"[dim]{network.exploded}[/]")
+            rows.append(("Expanded:", f"[dim]{network.exploded}[/]"))
 
         # Network addresses
-        info_table.add_row("Network:", f"[bold blue]{network.network_address}[/]")
-        info_table.add_row("Broadcast:", f"[bold blue]{network.broadcast_address}[/]")
+        rows.append(("Network:", f"[bold blue]{fmt(network_int)}[/]"))
+        rows.append(("Broadcast:", f"[bold blue]{fmt(broadcast_int)}[/]"))
 
         # Host range display based on network size
         if network.num_addresses == 1:
             # /32 and /128
-            info_table.add_row("Host:", f"[bold cyan]{network[0]}[/]")
+            rows.append(("Host:", f"[bold cyan]{fmt(network_int)}[/]"))
         elif network.num_addresses == 2:
             # /31 and /127
-            info_table.add_row(
-                "Hosts:", f"[bold cyan]{network[0]}[/] to [bold cyan]{network[1]}[/]"
+            host_start = fmt(network_int)
+            host_end = fmt(broadcast_int)
+            rows.append(
+                ("Hosts:", f"[bold cyan]{host_start}[/] to [bold cyan]{host_end}[/]")
             )
         else:
-            host_start = network.network_address + 1
-            host_end = network.broadcast_address - 1
-            info_table.add_row(
-                "Hosts:", f"[bold cyan]{host_start}[/] to [bold cyan]{host_end}[/]"
+            host_start = fmt(network_int + 1)
+            host_end = fmt(broadcast_int - 1)
+            rows.append(
+                ("Hosts:", f"[bold cyan]{host_start}[/] to [bold cyan]{host_end}[/]")
             )
 
         # IPv4 hexadecimal representation
         if network.version == 4:
-            info_table.add_row(
-                "Hexadecimal:", f"[bold yellow]{int(network.network_address):X}[/]"
-            )
+            rows.append(("Hexadecimal:", f"[bold yellow]{network_int:X}[/]"))
 
         # Network flags with color coding
         flags = self._get_network_flags(network)
@@ -208,7 +371,14 @@ class SubnetCalculator:
                     colored_flags.append(f"[red]{flag}[/]")
                 else:
                     colored_flags.append(f"[dim]{flag}[/]")
-            info_table.add_row("Flags:", " ".join(colored_flags))
+            rows.append(("Flags:", " ".join(colored_flags)))
+
+        # Create main info table
+        info_table = Table.grid(padding=(0, 2))
+        info_table.add_column(style="bold cyan", no_wrap=True)
+        info_table.add_column(style="white")
+        for label, value in rows:
+            info_table.add_row(label, value)
 
         # Create the panel with the info table
         panel_title = f"Network Information: {network.with_prefixlen}"
@@ -227,27 +397,17 @@ class SubnetCalculator:
         self, network: ipaddress.IPv4Network | ipaddress.IPv6Network
     ) -> list[str]:
         """Get list of network flags."""
-        flags = []
-        if network.is_multicast:
-            flags.append("MCAST")
-        if network.is_private:
-            flags.append("PRIVATE")
-        if network.is_global:
-            flags.append("GLOBAL")
-        if network.is_unspecified:
-            flags.append("UNSPECIFIED")
-        if network.is_reserved:
-            flags.append("RESERVED")
-        if network.is_loopback:
-            flags.append("LOOPBACK")
-        if network.is_link_local:
-            flags.append("LINK_LOCAL")
-        return flags
-
-    def _create_subnet_table(self, total_subnets: int) -> Table:
+        return list(
+            _flags_for(int(network.network_address), network.prefixlen, network.version)
+        )
+
+    def _create_subnet_table(self, rows: list[tuple[str, str, str]]) -> "Table":
         """Create a Rich table for subnet display."""
+        from rich import box
+        from rich.table import Table
+
         table = Table(
-            box=self.table_config.box_style,
+            box=getattr(box, self.table_config.box_style),
             border_style=self.table_config.border_style,
             show_header=True,
         )
@@ -256,16 +416,99 @@ class SubnetCalculator:
         table.add_column("Nbr of hosts", justify="center", style=HOST_COUNT_STYLE)
         table.add_column("Range of hosts", justify="left", style=HOST_RANGE_STYLE)
 
+        for row in rows:
+            table.add_row(*row)
+
         return table
 
+    def _render_subnet_table(self, rows: list[tuple[str, str, str]]) -> "Text | Table":
+        """Render the subnet rows as a boxed table.
+
+        The rows all have the same shape, so the column widths are simply the
+        longest cells and Rich's table layout is only needed when they do not
+        fit in the terminal.
+        """
+        from rich import box
+        from rich.text import Text
+
+        headers = ("Prefixes", "Nbr of hosts", "Range of hosts")
+        styles = (DEFAULT_TABLE_STYLE, HOST_COUNT_STYLE, HOST_RANGE_STYLE)
+        widths = [
+            max([len(header)] + [len(row[i]) for row in rows])
+            for i, header in enumerate(headers)
+        ]
+        # Cells padding and borders take 10 columns, the panel around the table 6
+        if sum(widths) + 10 > self.console.width - 6:
+            return self._create_subnet_table(rows)
+
+        table_box = getattr(box, self.table_config.box_style)
+        border_style = self.table_config.border_style
+
+        def justify(cells: tuple[str, str, str]) -> list[str]:
+            # Hosts count is centered, other columns are left aligned
+            count, count_width = cells[1], widths[1]
+            left = (count_width - len(count)) // 2
+            return [
+                cells[0].ljust(widths[0]),
+                (" " * left + count).ljust(count_width),
+                cells[2].ljust(widths[2]),
+            ]
+
+        text = Text(no_wrap=True, overflow="crop")
+
+        def append_line(
+            cells: list[str], cell_styles: tuple[str, ...], edges: tuple[str, str, str]
+        ) -> None:
+            left, vertical, right = edges
+            text.append(left, style=border_style)
+            for i, (cell, style) in enumerate(zip(cells, cell_styles)):
+                if i:
+                    text.append(vertical, style=border_style)
+                text.append(f" {cell} ", style=style)
+            text.append(f"{right}\n", style=border_style)
+
+        padded_widths = [width + 2 for width in widths]
+        text.append(table_box.get_top(padded_widths) + "\n", style=border_style)
+        append_line(
+            justify(headers),
+            ("bold",) * 3,
+            (table_box.head_left, table_box.head_vertical, table_box.head_right),
+        )
+        text.append(
+            table_box.get_row(padded_widths, level="head") + "\n", style=border_style
+        )
+        for row in rows:
+            append_line(
+                justify(row),
+                styles,
+                (table_box.mid_left, table_box.mid_vertical, table_box.mid_right),
+            )
+        text.append(table_box.get_bottom(padded_widths), style=border_style)
+
+        return text
+
     def _display_subnet_table_in_panel(
-        self, table: Table, total_subnets: int, overflow_message: Optional[str] = None
+        self,
+        rows: list[tuple[str, str, str]],
+        total_subnets: int,
+        overflow_message: Optional[str] = None,
     ) -> None:
         """Display the subnet table wrapped in a Rich panel."""
+        if self._plain:
+            self._emit_rows_plain(rows)
+            if overflow_message:
+                print(overflow_message, file=sys.stderr)
+            return
+
+        from rich import box
         from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
+
+        table = self._render_subnet_table(rows)
 
         # Create panel with the table
-        panel_title = f"Total: {total_subnets:,G} subnets"
+        panel_title = f"Total: {_fmt_count(total_subnets)} subnets"
 
         # If there's an overflow message, combine table with message
         if overflow_message:
@@ -285,30 +528,62 @@ class SubnetCalculator:
 
         self.console.print(panel)
 
-    def _add_subnet_row(
-        self, subnet: ipaddress.IPv4Network | ipaddress.IPv6Network, table: Table
-    ) -> None:
-        """Add a subnet row to the table."""
-        if subnet.num_addresses == 1:
+    def _emit_rows_plain(self, rows: list[tuple[str, str, str]]) -> None:
+        """Write the subnet rows as tab separated values."""
+        output = self.console.file
+        for row in rows:
+            output.write("\t".join(row) + "\n")
+        output.flush()
+
+    def _subnet_row_formatter(
+        self, step: int, new_prefix_len: int, version: int
+    ) -> Callable[[int], tuple[str, str, str]]:
+        """Return a function building a subnet row from the int of its first address.
+
+        All the subnets of a split have the same size, so the host count and the
+        shape of the host range are decided once instead of for every row.
+        """
+        fmt = _fmt_v4 if version == 4 else _fmt_v6
+        prefix_len = f"/{new_prefix_len}"
+
+        if step == 1:
             # /32 and /128
-            table.add_row(
-                str(subnet),
-                "1",
-                str(subnet[0]),
-            )
-        elif subnet.num_addresses == 2:
+            def format_row(start: int) -> tuple[str, str, str]:
+                first_address = fmt(start)
+                return first_address + prefix_len, "1", first_address
+
+        elif step == 2:
             # /31 and /127
-            table.add_row(
-                str(subnet),
-                "2",
-                f"{subnet[0]} to {subnet[1]}",
-            )
+            def format_row(start: int) -> tuple[str, str, str]:
+                first_address = fmt(start)
+                return (
+                    first_address + prefix_len,
+                    "2",
+                    f"{first_address} to {fmt(start + 1)}",
+                )
+
         else:
-            table.add_row(
-                str(subnet),
-                f"{subnet.num_addresses - 2:,G}",
-                f"{subnet.network_address + 1} to {subnet.broadcast_address - 1}",
-            )
+            host_count = f"{step - 2:,}"
+            last_host_offset = step - 2
+
+            def format_row(start: int) -> tuple[str, str, str]:
+                return (
+                    fmt(start) + prefix_len,
+                    host_count,
+                    f"{fmt(start + 1)} to {fmt(start + last_host_offset)}",
+                )
+
+        return format_row
+
+    def _subnet_starts(
+        self,
+        network: ipaddress.IPv4Network | ipaddress.IPv6Network,
+        new_prefix_len: int,
+    ) -> range:
+        """Return the integer value of the first address of each subnet (lazy range)."""
+        base = int(network.network_address)
+        step = 1 << (network.max_prefixlen - new_prefix_len)
+        return range(base, base + network.num_addresses, step)
 
     def split_subnet_by_prefix(
         self,
@@ -318,20 +593,23 @@ class SubnetCalculator:
         """Split subnet by specifying new prefix length."""
         try:
             total_subnets = self._calculate_split_count(
-                network.prefixlen, new_prefix_len
+                network.prefixlen, new_prefix_len, network.max_prefixlen
             )
-            table = self._create_subnet_table(total_subnets)
+            rows: list[tuple[str, str, str]] = []
             overflow_message = None
+            if total_subnets > MAX_DISPLAYED_SUBNETS:
+                overflow_message = (
+                    f"... Only showing first {MAX_DISPLAYED_SUBNETS} subnets ..."
+                )
+
+            starts = self._subnet_starts(network, new_prefix_len)
+            format_row = self._subnet_row_formatter(
+                starts.step, new_prefix_len, network.version
+            )
+            for start in itertools.islice(starts, MAX_DISPLAYED_SUBNETS):
+                rows.append(format_row(start))
 
-            for i, subnet in enumerate(network.subnets(new_prefix=new_prefix_len)):
-                if i >= MAX_DISPLAYED_SUBNETS:
-                    overflow_message = (
-                        f"... Only showing first {MAX_DISPLAYED_SUBNETS} subnets ..."
-                    )
-                    break
-                self._add_subnet_row(subnet, table)
-
-            self._display_subnet_table_in_panel(table, total_subnets, overflow_message)
+            self._display_subnet_table_in_panel(rows, total_subnets, overflow_message)
 
         except ValueError as e:
             error_handler.print_error(
@@ -355,26 +633,33 @@ class SubnetCalculator:
             # in 8 parts: /27 -> x = 3 bits longer -> 2**3 = 8
             # in 16 parts: /28
             # ...
-            # Calculating the base 2 logarithm of split_num, so that 2**x = split_num
-            # Result is rounded up for cases where split_num is not a power of 2.
-            prefix_diff = math.ceil(math.log(split_count, 2))
+            # x is the number of bits needed to count up to split_num - 1, so that
+            # 2**x >= split_num. This rounds up when split_num is not a power of 2,
+            # and stays exact with integers, unlike a floating point log2.
+            if split_count < 1:
+                raise ValueError("Split count must be at least 1")
+            prefix_diff = (split_count - 1).bit_length()
+            new_prefix_len = network.prefixlen + prefix_diff
             total_subnets = self._calculate_split_count(
-                network.prefixlen, network.prefixlen + prefix_diff
+                network.prefixlen, new_prefix_len, network.max_prefixlen
             )
-            table = self._create_subnet_table(total_subnets)
+            rows: list[tuple[str, str, str]] = []
             overflow_message = None
+            if total_subnets > MAX_DISPLAYED_SUBNETS:
+                overflow_message = (
+                    f"... Only showing first {MAX_DISPLAYED_SUBNETS} subnets ..."
+                )
+
+            starts = self._subnet_starts(network, new_prefix_len)
+            format_row = self._subnet_row_formatter(
+                starts.step, new_prefix_len, network.version
+            )
+            for start in itertools.islice(starts, MAX_DISPLAYED_SUBNETS):
+                rows.append(format_row(start))
 
-            for i, subnet in enumerate(network.subnets(prefixlen_diff=prefix_diff)):
-                if i >= MAX_DISPLAYED_SUBNETS:
-                    overflow_message = (
-                        f"... Only showing first {MAX_DISPLAYED_SUBNETS} subnets ..."
-                    )
-                    break
-                self._add_subnet_row(subnet, table)
-
-            self._display_subnet_table_in_panel(table, total_subnets, overflow_message)
+            self._display_subnet_table_in_panel(rows, total_subnets, overflow_message)
 
-        except (ValueError, ArithmeticError) as e:
+        except ValueError as e:
             error_handler.print_error(
                 type(e).__name__,
                 str(e),
@@ -382,10 +667,14 @@ class SubnetCalculator:
             )
             raise typer.Exit(1)
 
-    def _calculate_split_count(self, original_prefix: int, new_prefix: int) -> int:
+    def _calculate_split_count(
+        self, original_prefix: int, new_prefix: int, max_prefix: int
+    ) -> int:
         """Calculate number of subnets created by splitting."""
         if new_prefix <= original_prefix:
             raise ValueError("New prefix length must be longer than original length")
+        if new_prefix > max_prefix:
+            raise ValueError(f"New prefix length must not be longer than {max_prefix}")
         return 2 ** (new_prefix - original_prefix)
 
 
@@ -410,27 +699,23 @@ def main_callback(ctx: typer.Context) -> None:
     """
     if ctx.invoked_subcommand is None:
         # No subcommand was invoked, show informational message
-        console = Console()
+        from rich import box
+        from rich.panel import Panel
+        from rich.text import Text
 
-        console.print()  # Add spacing
+        console = _stdout()
 
         # Create main informational message
-        info_text = Text()
-        info_text.append("Available commands:\n", style="bold yellow")
-        info_text.append("• ", style="dim")
-        info_text.append("info", style="bold green")
-        info_text.append(
-            "     - Display comprehensive network information\n", style="white"
+        info_text = Text.from_markup(
+            "[bold yellow]Available commands:[/]\n"
+            "[dim]• [/][bold green]info[/]"
+            "[white]     - Display comprehensive network information[/]\n"
+            "[dim]• [/][bold green]split[/]"
+            "[white]    - Split networks into smaller subnets[/]\n"
+            "[dim]• [/][bold green]examples[/][white] - Show usage examples[/]\n\n"
+            "[dim]Use [/][bold cyan]--help[/]"
+            "[dim] with any command for detailed information.[/]"
         )
-        info_text.append("• ", style="dim")
-        info_text.append("split", style="bold green")
-        info_text.append("    - Split networks into smaller subnets\n", style="white")
-        info_text.append("• ", style="dim")
-        info_text.append("examples", style="bold green")
-        info_text.append(" - Show usage examples\n\n", style="white")
-        info_text.append("Use ", style="dim")
-        info_text.append("--help", style="bold cyan")
-        info_text.append(" with any command for detailed information.", style="dim")
 
         # Create panel with the informational message
         panel = Panel(
@@ -442,14 +727,17 @@ def main_callback(ctx: typer.Context) -> None:
             padding=(1, 2),
         )
 
-        console.print(panel)
-
         # Display Python environment information
         python_panel = create_python_info_panel(console)
-        console.print(python_panel)
+
+        # Buffer the output so it is flushed to the terminal only once
+        with console:
+            console.print()  # Add spacing
+            console.print(panel)
+            console.print(python_panel)
 
 
-def create_python_info_panel(console: Console) -> Panel:
+def create_python_info_panel(console: "Console") -> "Panel":
     """
     Create a Rich panel displaying Python version and execution environment information.
 
@@ -459,6 +747,10 @@ def create_python_info_panel(console: Console) -> Panel:
     Returns:
         Panel: Formatted panel with Python information
     """
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
     env_info = get_execution_environment()
 
     # Create info table
@@ -496,13 +788,42 @@ def create_python_info_panel(console: Console) -> Panel:
     return panel
 
 
+# Rendered examples panel, keyed by script name, console width and color system
+_examples_cache: dict[tuple[str, int, Optional[str]], str] = {}
+
+
 def show_examples():
     """Display examples in a properly formatted Rich panel."""
-    console = Console()
+    console = _stdout()
 
     # Get the current script name dynamically
     script_name = os.path.basename(sys.argv[0])
 
+    # The panel only depends on the script name and the terminal, render it once
+    cache_key = (script_name, console.width, console.color_system)
+    if cache_key not in _examples_cache:
+        with console.capture() as capture:
+            console.print(create_examples_panel(script_name))
+        _examples_cache[cache_key] = capture.get()
+
+    sys.stdout.write(_examples_cache[cache_key])
+    sys.stdout.flush()
+
+
+def create_examples_panel(script_name: str) -> "Panel":
+    """
+    Create a Rich panel displaying usage examples for all commands.
+
+    Args:
+        script_name: Name of the script, as typed by the user
+
+    Returns:
+        Panel: Formatted panel with the examples
+    """
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
     # Create examples table
     examples_table = Table.grid(padding=(0, 1))
     examples_table.add_column(style="dim", no_wrap=True)  # Description
@@ -553,7 +874,21 @@ def show_examples():
         padding=(1, 2),
     )
 
-    console.print(panel)
+    return panel
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(
+    prefix: str, mask: Optional[str]
+) -> ipaddress.IPv4Network | ipaddress.IPv6Network:
+    """Parse and cache a network, raise ValueError if the input is invalid."""
+    if mask is None:
+        prefix_interface = ipaddress.ip_interface(prefix)
+    else:
+        prefix_string = f"{prefix}/{mask}"
+        prefix_interface = ipaddress.ip_interface(prefix_string)
+
+    return prefix_interface.network
 
 
 def parse_network_input(
@@ -567,13 +902,7 @@ def parse_network_input(
         An ipaddress.IPv4Network or ipaddress.IPv6Network object
     """
     try:
-        if mask is None:
-            prefix_interface = ipaddress.ip_interface(prefix)
-        else:
-            prefix_string = f"{prefix}/{mask}"
-            prefix_interface = ipaddress.ip_interface(prefix_string)
-
-        return prefix_interface.network
+        return _parse_cached(prefix, mask)
     except ValueError as e:
         error_handler.print_error(
             type(e).__name__,